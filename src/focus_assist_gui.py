@@ -38,8 +38,9 @@ from pomodoro import PomodoroTimer, Task, TaskStatus, TimerState, TerminalOutput
 from pomodoro.constants import (
     DEMO_WORK_SECONDS, DEMO_SHORT_BREAK_SECONDS, DEMO_LONG_BREAK_SECONDS,
     DEFAULT_WORK_SECONDS, DEFAULT_SHORT_BREAK_SECONDS,
-    DEFAULT_LONG_BREAK_SECONDS
+    DEFAULT_LONG_BREAK_SECONDS, MAX_TIMER_SLEEP_SECONDS
 )
+from pomodoro.utils import format_timer_display
 from eventlogging import SessionEventLogger
 
 # global variables
@@ -183,7 +184,7 @@ class TaskCard(ctk.CTkFrame):
         
         self.status_label = ctk.CTkLabel(
             header,
-            text=f"● {self.task.status.value.replace('_', ' ').title()}",
+            text=f"● {self.task.status.label}",
             font=ctk.CTkFont(size=12, weight='bold'),
             text_color=status_colors.get(self.task.status, self.theme['text_muted'])
         )
@@ -313,7 +314,7 @@ class TaskCard(ctk.CTkFrame):
             }
             
             self.status_label.configure(
-                text=f"● {self.task.status.value.replace('_', ' ').title()}",
+                text=f"● {self.task.status.label}",
                 text_color=status_colors.get(self.task.status, self.theme['text_muted'])
             )
         except Exception:
@@ -1674,7 +1675,7 @@ class FocusAssistApp:
         self.schedule_update('current_task')
         
         # Update timer colors to match current state
-        if hasattr(self, 'current_timer_state') and self.current_timer_state:
+        if hasattr(self, 'current_timer_state') and self.current_timer_state is not None:
             self.schedule_update('timer_colors')
         
         # Process all scheduled updates immediately
@@ -1688,7 +1689,7 @@ class FocusAssistApp:
         try:
             # Update main timer display colors only
             if hasattr(self, 'timer_frame_ref') and self.timer_frame_ref.winfo_exists():
-                if hasattr(self, 'current_timer_state') and self.current_timer_state:
+                if hasattr(self, 'current_timer_state') and self.current_timer_state is not None:
                     colors = self.get_state_colors(self.current_timer_state)
                     self.timer_frame_ref.configure(
                         fg_color=colors['primary'],
@@ -2602,7 +2603,7 @@ class FocusAssistApp:
             if self.timer and self.is_timer_running:
                 # Update the timer's task list with the new task
                 with self.timer._lock:
-                    self.timer._tasks = self.tasks.copy()
+                    self.timer._tasks = tuple(self.tasks)
                 self.update_status(f"Added task '{task.title}' to active timer session")
             else:
                 self.update_status(f"Added task '{task.title}'")
@@ -2628,7 +2629,7 @@ class FocusAssistApp:
             if self.timer and self.is_timer_running:
                 # Update the timer's task list with the edited task
                 with self.timer._lock:
-                    self.timer._tasks = self.tasks.copy()
+                    self.timer._tasks = tuple(self.tasks)
                 self.update_status(f"Updated task '{task.title}' in active timer session")
             else:
                 self.update_status(f"Updated task '{task.title}'")
@@ -2664,7 +2665,7 @@ class FocusAssistApp:
                 if self.timer and self.is_timer_running:
                     # Update the timer's task list with the updated tasks
                     with self.timer._lock:
-                        self.timer._tasks = self.tasks.copy()
+                        self.timer._tasks = tuple(self.tasks)
                         # Update the timer's current task index if needed
                         if self.timer._current_task_idx >= len(self.tasks):
                             self.timer._current_task_idx = max(0, len(self.tasks) - 1)
@@ -2725,7 +2726,7 @@ class FocusAssistApp:
             work_seconds=work_time,
             short_break_seconds=short_break,
             long_break_seconds=long_break,
-            tasks=self.tasks.copy(),  # Use a copy to avoid reference issues
+            tasks=self.tasks,  # Timer keeps its own tuple of the current tasks
             ai_checkin_interval_seconds=self.settings['ai']['checkin_interval_seconds']
         )
         
@@ -2810,6 +2811,7 @@ class FocusAssistApp:
             
             # Force timer to idle state
             self.timer.pause()  # This will stop the timer
+            self.timer.close()
             self.timer = None
             self.start_pause_btn.configure(text="START")
             
@@ -2855,7 +2857,7 @@ class FocusAssistApp:
             # Only allow skipping from active states
             valid_skip_states = [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK, TimerState.PAUSED]
             if current_state not in valid_skip_states:
-                self.update_status(f"Cannot skip from current state: {current_state.value}")
+                self.update_status(f"Cannot skip from current state: {current_state.label}")
                 return
                 
             # Thread-safe skip operation
@@ -2885,6 +2887,8 @@ class FocusAssistApp:
             # Log additional debug info
             try:
                 timer_state = getattr(self.timer, 'state', 'unknown') if self.timer else 'no timer'
+                # TimerState is an IntEnum: print its name, not the bare int
+                timer_state = getattr(timer_state, 'label', timer_state)
                 print(f"Debug: Timer state: {timer_state}, Running: {self.is_timer_running}")
             except:
                 print("Debug: Unable to get timer debug info")
@@ -2903,7 +2907,7 @@ class FocusAssistApp:
         }
         
         target_state = mode_to_state.get(mode)
-        if not target_state:
+        if target_state is None:
             return
             
         # Check if we're already in the target state
@@ -2931,18 +2935,18 @@ class FocusAssistApp:
         """Main timer loop - runs independently of AI inference"""
         last_time_str = ""
         last_state = None
-        sync_counter = 0
+        last_sync = time.monotonic()
         
         # Timer loop running independently of AI inference
         
         while self.is_timer_running and self.timer:
             try:
-                remaining_time = self.timer.get_remaining_time()
-                if remaining_time:
+                # One locked pass yields remaining time and state together
+                tick = self.timer.tick()
+                remaining_seconds = tick.remaining_seconds
+                if remaining_seconds:
                     # Update display only if changed
-                    total_seconds = int(remaining_time.total_seconds())
-                    minutes, seconds = int(total_seconds // 60), int(total_seconds % 60)
-                    time_str = f"{minutes:02d}:{seconds:02d}"
+                    time_str = format_timer_display(remaining_seconds)
                     
                     if time_str != last_time_str:
                         last_time_str = time_str
@@ -2950,18 +2954,28 @@ class FocusAssistApp:
                         self.root.after(0, lambda t=time_str: self.safe_update_timer_display(t))
                     
                     # Update colors only if state changed
-                    if self.timer and self.timer.state != last_state:
-                        last_state = self.timer.state
+                    if tick.state != last_state:
+                        last_state = tick.state
                         self.root.after(0, lambda s=last_state: self.update_timer_colors(s))
                     
                     # Periodic sync to ensure GUI stays synchronized with timer
-                    sync_counter += 1
-                    if sync_counter >= 10:  # Every 10 seconds
-                        sync_counter = 0
+                    # (timed by the clock: the loop's wake-up rate varies with state)
+                    now = time.monotonic()
+                    if now - last_sync >= 1.0:  # Every second
+                        last_sync = now
                         self.root.after(0, self.sync_tasks_from_timer)
                         
-                # Small sleep to prevent CPU spinning - timer continues regardless of AI
-                time.sleep(0.1)  # Reduced from 1 second for more responsive updates
+                # While counting down, sleep until the displayed second rolls over
+                # or the timer's next event (interval end / AI snapshot). Paused and
+                # skipped displays don't tick, so just wait the maximum.
+                delay = MAX_TIMER_SLEEP_SECONDS
+                next_event = self.timer.next_event_time() if self.timer else None
+                if next_event is not None and tick.state not in (TimerState.PAUSED, TimerState.SKIPPED):
+                    if remaining_seconds:
+                        delay = remaining_seconds % 1
+                    delay = min(delay, next_event - time.monotonic())
+                # Small margin so we wake just past the boundary, not just before it
+                time.sleep(min(max(delay, 0.0) + 0.01, MAX_TIMER_SLEEP_SECONDS))
                 
             except Exception as e:
                 print(f"Timer loop error (continuing): {e}")
@@ -3008,8 +3022,9 @@ class FocusAssistApp:
                 except Exception as e:
                     print(f"Terminal display error: {e}")
                 
-                # Small sleep to prevent CPU spinning - terminal continues regardless of AI
-                time.sleep(0.1)
+                # Terminal output changes at most every few seconds; poll on the
+                # same bounded schedule as the timer loop
+                time.sleep(MAX_TIMER_SLEEP_SECONDS)
                 
         except Exception as e:
             print(f"Terminal loop error: {e}")
@@ -3020,13 +3035,13 @@ class FocusAssistApp:
         """Handle timer state changes with comprehensive error handling"""
         try:
             # Validate state parameter
-            if not state or not hasattr(state, 'value'):
+            if state is None or not hasattr(state, 'label'):
                 print("Error: Invalid state passed to on_timer_state_changed")
                 return
                 
             # Safe state text conversion
             try:
-                state_text = state.value.replace('_', ' ').title()
+                state_text = state.label
                 self.update_status(f"Timer state: {state_text}")
             except Exception as e:
                 print(f"Error updating status for state change: {e}")
@@ -3047,7 +3062,7 @@ class FocusAssistApp:
                     # When paused, check if timer has updated _pre_pause_state (from skip_to_state)
                     if (self.timer and 
                         hasattr(self.timer, '_pre_pause_state') and 
-                        getattr(self.timer, '_pre_pause_state', None)):
+                        getattr(self.timer, '_pre_pause_state', None) is not None):
                         # Update last_active_state to reflect the new paused state
                         self.last_active_state = self.timer._pre_pause_state
                 elif state == TimerState.SKIPPED:
@@ -3103,6 +3118,7 @@ class FocusAssistApp:
             # Stop the timer but don't destroy it - we'll recreate it when needed
             if self.timer:
                 self.timer.pause()  # Stop the timer
+                self.timer.close()
                 self.timer = None  # Clear the timer to force recreation on next start
             
             # Reset UI elements
@@ -3490,6 +3506,8 @@ class FocusAssistApp:
             self.is_timer_running = False
             if self.timer:
                 self.timer.pause()
+        if self.timer:
+            self.timer.close()
         
         # Shutdown AI thread pool
         if hasattr(self, 'ai_executor'):
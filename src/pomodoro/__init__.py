@@ -2,10 +2,10 @@
 Focus Assist - Pomodoro timer with AI-powered focus tracking
 """
 
-from .timer import PomodoroTimer, Task, TaskStatus, TimerState
+from .timer import PomodoroTimer, Task, TaskStatus, TimerState, TickResult
 from .terminal_output import TerminalOutput
 
 __all__ = [
-    'PomodoroTimer', 'Task', 'TaskStatus', 'TimerState', 
+    'PomodoroTimer', 'Task', 'TaskStatus', 'TimerState', 'TickResult',
     'TerminalOutput'
 ] 
\ No newline at end of file
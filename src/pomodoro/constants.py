@@ -21,6 +21,8 @@ MAX_ESTIMATED_POMODOROS = 50
 
 # Threading and Performance
 SKIP_DISPLAY_DURATION_SECONDS = 0.5
+MAX_ROLLOVERS_PER_POLL = 8  # Interval transitions handled by a single remaining-time poll
+MAX_TIMER_SLEEP_SECONDS = 0.5  # Upper bound on a display loop's wait between timer polls
 
 # Basic limits
 class Limits:
@@ -38,6 +40,10 @@ class ErrorMessages:
     INVALID_TASKS = "At least one task is required"
     TOO_MANY_TASKS = f"Maximum {MAX_TASKS_EDGE_DEVICE} tasks supported on edge devices"
     INVALID_POMODOROS = "estimated_pomodoros must be positive"
+    TOO_MANY_POMODOROS = f"estimated_pomodoros must be at most {MAX_ESTIMATED_POMODOROS}"
+    INVALID_COMPLETED_POMODOROS = "completed_pomodoros cannot be negative"
+    INVALID_TASK_TITLE = f"title must be between 1 and {MAX_TASK_TITLE_LENGTH} characters"
+    INVALID_TASK_DESCRIPTION = f"description must be at most {MAX_TASK_DESCRIPTION_LENGTH} characters"
     INVALID_TIME_INTERVALS = "All time intervals must be positive"
     INVALID_LONG_BREAK_COUNT = "pomos_before_long_break must be positive"
     TIMER_START_ERROR = "Timer start error"
@@ -3,44 +3,52 @@ Simple event logging terminal output for Focus Assist.
 No dependencies - just prints when events are logged.
 """
 
+import sys
 import time
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .timer import PomodoroTimer
 
+# Invariant output blocks, rendered once at import
+_BANNER = "Terminal Output - Event Logger Mode\n" + "=" * 50 + "\n"
+_HEADER = (
+    "Focus Assist - Event Logging Terminal Output\n"
+    "Monitoring event logger for updates...\n"
+    + "-" * 50 + "\n"
+)
+
+def _write(text: str) -> None:
+    """Write to stdout; a no-op when there is none (e.g. under pythonw)."""
+    out = sys.stdout
+    if out is not None:
+        out.write(text)
+
+
 class TerminalOutput:
     """Simple terminal output that prints event logger updates."""
     
     def __init__(self, debug: bool = False):
         self.debug = debug
-        self._last_print_time = 0
-        print("Terminal Output - Event Logger Mode")
-        print("=" * 50)
+        self._last_print_time = 0.0
+        _write(_BANNER)
     
     def print_header(self) -> None:
         """Print simple header."""
-        print("Focus Assist - Event Logging Terminal Output")
-        print("Monitoring event logger for updates...")
-        print("-" * 50)
+        _write(_HEADER)
         
     def update_display(self, timer: 'PomodoroTimer') -> bool:
         """Simple display update - just print current status occasionally."""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Print status every 5 seconds to avoid spam
         if current_time - self._last_print_time >= 5:
             self._last_print_time = current_time
             
             if timer:
-                remaining = timer.get_remaining_time()
-                if remaining:
-                    total_seconds = int(remaining.total_seconds())
-                    minutes = total_seconds // 60
-                    seconds = total_seconds % 60
-                    
-                    state_name = timer.state.value.replace('_', ' ').title()
-    
+                # Polling advances the timer through completed intervals; the
+                # event logger owns all visible output, so nothing is rendered here
+                timer.get_remaining_seconds()
         
         return True
     
@@ -54,9 +62,10 @@ class TerminalOutput:
     
     def print_final_statistics(self, timer: 'PomodoroTimer') -> None:
         """Print final statistics."""
-        print("Session completed!")
+        parts = ["Session completed!\n"]
         if timer and hasattr(timer, 'completed_pomos'):
-            print(f"Completed pomodoros: {timer.completed_pomos}")
+            parts.append(f"Completed pomodoros: {timer.completed_pomos}\n")
+        _write("".join(parts))
     
     def get_stats(self) -> dict:
         """Get simple stats."""
@@ -67,14 +76,14 @@ class TerminalOutput:
 def print_event_logged(event_type: str, **kwargs):
     """Print when an event is logged to the event logger."""
     timestamp = time.strftime("%H:%M:%S")
-    print(f"[{timestamp}] event_type : {event_type}")
+    parts = ["[", timestamp, "] event_type : ", event_type, "\n"]
     
-    # Print event data if available
-    if kwargs:
-        for key, value in kwargs.items():
-            print(f"    {key}: {value}")
+    # Event data, one indented line per field
+    for key, value in kwargs.items():
+        parts += ("    ", key, ": ", str(value), "\n")
     
-    print()  # Empty line for readability
+    parts.append("\n")  # Empty line for readability
+    _write("".join(parts))
 
 
 def print_timer_start_event(pomodoro_length: int, break_length: int, long_break_length: int):
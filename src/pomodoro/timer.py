@@ -1,52 +1,113 @@
-from datetime import datetime, timedelta
-from enum import Enum
-from typing import List, Optional, Callable
-from pydantic import BaseModel, Field, validator
+from datetime import timedelta
+from enum import IntEnum
+from typing import List, Optional, Callable, Tuple
 import threading
-import time
-from dataclasses import dataclass
-from .constants import MAX_TASKS_EDGE_DEVICE, MAX_TASK_TITLE_LENGTH, MAX_TASK_DESCRIPTION_LENGTH, MAX_ESTIMATED_POMODOROS, SKIP_DISPLAY_DURATION_SECONDS, ErrorMessages
-from .utils import safe_execute_bool, safe_execute_none, ValidationUtils
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic_ns as _monotonic_ns
+from dataclasses import dataclass, field
+from .constants import MAX_TASK_TITLE_LENGTH, MAX_TASK_DESCRIPTION_LENGTH, MAX_ESTIMATED_POMODOROS, SKIP_DISPLAY_DURATION_SECONDS, MAX_ROLLOVERS_PER_POLL, ErrorMessages
+from .utils import safe_execute_bool, safe_execute_none, validate_task_list
 
+# Timestamps and durations are integer nanoseconds internally (no FP drift)
+_NS_PER_SECOND = 1_000_000_000
+_SKIP_DISPLAY_NS = int(SKIP_DISPLAY_DURATION_SECONDS * _NS_PER_SECOND)
+_ZERO_TD = timedelta(0)
 
-class TaskStatus(Enum):
-    NOT_STARTED = "not_started"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    PAUSED = "paused"
+# Bits of PomodoroTimer._flags
+_FLAG_SKIP_DISPLAY = 1  # SKIPPED display has been shown at least once
+_FLAG_START_PAUSED = 2  # skip_to_state() began while paused; pause the new state
+_FLAG_CLOSED = 4  # close() has run; snapshots are no longer submitted
 
 
-class Task(BaseModel):
+class TaskStatus(IntEnum):
+    NOT_STARTED = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    PAUSED = 3
+
+    @property
+    def label(self) -> str:
+        """Human-readable status name for display."""
+        return _TASK_STATUS_LABELS[self]
+
+
+_TASK_STATUS_LABELS = ("Not Started", "In Progress", "Completed", "Paused")
+
+
+@dataclass(slots=True, kw_only=True)
+class Task:
+    """Unit of work tracked by the timer; validated once at construction."""
     id: str
-    title: str = Field(..., min_length=1, max_length=MAX_TASK_TITLE_LENGTH)
-    description: Optional[str] = Field(None, max_length=MAX_TASK_DESCRIPTION_LENGTH)
-    estimated_pomodoros: int = Field(..., gt=0, le=MAX_ESTIMATED_POMODOROS)
-    completed_pomodoros: int = Field(default=0, ge=0)
+    title: str
+    description: Optional[str] = None
+    estimated_pomodoros: int
+    completed_pomodoros: int = 0
     status: TaskStatus = TaskStatus.NOT_STARTED
 
-    @validator('estimated_pomodoros')
-    def validate_pomodoros(cls, v):
-        if v <= 0:
+    def __post_init__(self):
+        if not 1 <= len(self.title) <= MAX_TASK_TITLE_LENGTH:
+            raise ValueError(ErrorMessages.INVALID_TASK_TITLE)
+        if self.description is not None and len(self.description) > MAX_TASK_DESCRIPTION_LENGTH:
+            raise ValueError(ErrorMessages.INVALID_TASK_DESCRIPTION)
+        if self.estimated_pomodoros <= 0:
             raise ValueError(ErrorMessages.INVALID_POMODOROS)
-        return v
+        if self.estimated_pomodoros > MAX_ESTIMATED_POMODOROS:
+            raise ValueError(ErrorMessages.TOO_MANY_POMODOROS)
+        if self.completed_pomodoros < 0:
+            raise ValueError(ErrorMessages.INVALID_COMPLETED_POMODOROS)
+
+
+class TimerState(IntEnum):
+    WORK = 0
+    SHORT_BREAK = 1
+    LONG_BREAK = 2
+    PAUSED = 3
+    SKIPPED = 4
+    IDLE = 5
+
+    @property
+    def label(self) -> str:
+        """Human-readable state name for display."""
+        return _TIMER_STATE_LABELS[self]
+
+
+_TIMER_STATE_LABELS = ("Work", "Short Break", "Long Break", "Paused", "Skipped", "Idle")
+
+# State groups for O(1) membership checks in the guards below
+_BREAK_STATES = frozenset({TimerState.SHORT_BREAK, TimerState.LONG_BREAK})
+_ACTIVE_STATES = _BREAK_STATES | {TimerState.WORK}
+_SKIPPABLE_STATES = _ACTIVE_STATES | {TimerState.PAUSED}
+
+# Next state after an interval completes normally, keyed by
+# (finished interval was WORK, long break due, current task remaining)
+_NEXT_STATE = {
+    (True, True, True): TimerState.LONG_BREAK,
+    (True, True, False): TimerState.LONG_BREAK,
+    (True, False, True): TimerState.SHORT_BREAK,
+    (True, False, False): TimerState.SHORT_BREAK,
+    (False, False, True): TimerState.WORK,
+    (False, False, False): TimerState.IDLE,
+}
 
 
-class TimerState(Enum):
-    WORK = "work"
-    SHORT_BREAK = "short_break"
-    LONG_BREAK = "long_break"
-    PAUSED = "paused"
-    SKIPPED = "skipped"
-    IDLE = "idle"
+@dataclass(slots=True)
+class TickResult:
+    """Snapshot of one timer poll."""
+    remaining_seconds: Optional[float]
+    take_snapshot: bool
+    state: TimerState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TimerConfig:
     """Immutable timer configuration for thread safety."""
     work_seconds: int
     short_break_seconds: int
     long_break_seconds: int
     pomos_before_long_break: int
+    # Interval length (ns) by state, derived in __post_init__
+    _length_by_state: dict = field(init=False, repr=False)
 
     def __post_init__(self):
         # Validate configuration
@@ -55,6 +116,13 @@ class TimerConfig:
             raise ValueError(ErrorMessages.INVALID_TIME_INTERVALS)
         if self.pomos_before_long_break <= 0:
             raise ValueError(ErrorMessages.INVALID_LONG_BREAK_COUNT)
+        # Precomputed lookup table (avoids if/elif chains on the poll path);
+        # frozen dataclass, so install it via object.__setattr__
+        object.__setattr__(self, '_length_by_state', {
+            TimerState.WORK: int(self.work_seconds * _NS_PER_SECOND),
+            TimerState.SHORT_BREAK: int(self.short_break_seconds * _NS_PER_SECOND),
+            TimerState.LONG_BREAK: int(self.long_break_seconds * _NS_PER_SECOND),
+        })
 
 
 class PomodoroTimer:
@@ -63,9 +131,10 @@ class PomodoroTimer:
     __slots__ = ('_config', '_tasks', '_current_task_idx', '_completed_pomos', 
                  '_state', '_start_time', '_end_time', 
                  '_lock', '_state_callbacks', '_pre_pause_state', '_paused_remaining',
-                 '_pre_skip_state', '_skipped_remaining', '_skip_display_shown', '_target_state',
-                 '_start_new_state_paused', '_ai_checkin_interval', '_last_ai_snapshot', 
-                 '_ai_snapshot_callbacks')
+                 '_pre_skip_state', '_skipped_remaining', '_flags', '_target_state',
+                 '_ai_checkin_interval', '_next_ai_snapshot_at',
+                 '_ai_snapshot_callbacks', '_snapshot_executor',
+                 '_pending_states', '_delivery_lock', '_remaining_td_cache')
 
     def __init__(
         self,
@@ -74,12 +143,11 @@ class PomodoroTimer:
         long_break_seconds: int,
         tasks: List[Task],
         pomos_before_long_break: int = 4,
-        ai_checkin_interval_seconds: int = 30
+        ai_checkin_interval_seconds: int = 30,
+        thread_safe: bool = True
     ):
         # Validate inputs
-        ValidationUtils.validate_task_list(tasks)
-        if len(tasks) > MAX_TASKS_EDGE_DEVICE:
-            raise ValueError(ErrorMessages.TOO_MANY_TASKS)
+        validate_task_list(tasks)  # Also enforces MAX_TASKS_EDGE_DEVICE
             
         # Immutable config for thread safety
         self._config = TimerConfig(
@@ -89,423 +157,476 @@ class PomodoroTimer:
             pomos_before_long_break=pomos_before_long_break
         )
         
-        # State variables with thread lock
-        self._lock = threading.RLock()
-        self._tasks = tasks.copy()  # Defensive copy
+        # State variables with thread lock. thread_safe=False swaps in a no-op
+        # context for single-threaded use; the timer must then not be shared
+        # across threads.
+        # The lock is never re-entered: state callbacks are queued while it is
+        # held and delivered after release (see _flush_state_changes).
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        # Held by whichever thread is delivering queued states, so callbacks see
+        # them in queue order (only ever try-acquired, so never blocks)
+        self._delivery_lock = threading.Lock()
+        # Immutable backing store: copied once here, never on read. Replace the
+        # whole tuple to change the list; Task objects themselves stay mutable
+        # (status/progress) and are shared with the caller on purpose.
+        self._tasks: Tuple[Task, ...] = tuple(tasks)
         self._current_task_idx = 0
         self._completed_pomos = 0
         self._state = TimerState.IDLE
-        self._start_time: Optional[float] = None  # Use timestamp for performance
-        self._end_time: Optional[float] = None
+        self._start_time: Optional[int] = None  # Monotonic ns timestamps - only deltas are meaningful
+        self._end_time: Optional[int] = None
         self._pre_pause_state: Optional[TimerState] = None
-        self._paused_remaining: Optional[float] = None
+        self._paused_remaining: Optional[int] = None
         self._pre_skip_state: Optional[TimerState] = None
-        self._skipped_remaining: Optional[float] = None
-        self._skip_display_shown: bool = False
+        self._skipped_remaining: Optional[int] = None
         self._target_state: Optional[TimerState] = None
-        self._start_new_state_paused: bool = False
+        self._flags = 0  # _FLAG_* bits
         
         # Callback systems
-        self._state_callbacks: List[Callable[[TimerState], None]] = []
+        # Callback tuples are copy-on-write so they can be iterated without the lock
+        self._state_callbacks: Tuple[Callable[[TimerState], None], ...] = ()
+        self._pending_states: List[TimerState] = []  # Queued under the lock, delivered after
+        # (whole seconds, timedelta) from the last get_remaining_time(); one tuple so it swaps atomically
+        self._remaining_td_cache: Tuple[int, timedelta] = (0, _ZERO_TD)
         
         # AI monitoring system  
-        self._ai_checkin_interval = ai_checkin_interval_seconds  # Use provided interval (GUI enforces 30s minimum)
-        self._last_ai_snapshot: int = 0  # Track number of snapshots taken in current interval
-        self._ai_snapshot_callbacks: List[Callable[[], None]] = []
+        self._ai_checkin_interval = int(ai_checkin_interval_seconds * _NS_PER_SECOND)  # ns; GUI enforces 30s minimum
+        self._next_ai_snapshot_at: int = 0  # Absolute ns deadline of the next snapshot in this work interval
+        self._ai_snapshot_callbacks: Tuple[Callable[[], None], ...] = ()
+        # Single long-lived worker runs snapshot callbacks off the poll thread
+        self._snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pomo-snap")
+
+    # Getters read without the lock: a single attribute load is atomic
+    # under CPython's GIL. A reader may observe a value from the middle of a
+    # transition, which is fine because the UI re-polls.
 
     @property
     def state(self) -> TimerState:
-        """Thread-safe state access."""
-        with self._lock:
-            return self._state
+        """Lock-free state access."""
+        return self._state
 
     @property
     def current_task_idx(self) -> int:
-        """Thread-safe task index access."""
-        with self._lock:
-            return self._current_task_idx
+        """Lock-free task index access."""
+        return self._current_task_idx
 
     @property
     def completed_pomos(self) -> int:
-        """Thread-safe completed pomodoros access."""
-        with self._lock:
-            return self._completed_pomos
+        """Lock-free completed pomodoros access."""
+        return self._completed_pomos
 
     @property
-    def tasks(self) -> List[Task]:
-        """Thread-safe tasks access (returns copy)."""
-        with self._lock:
-            return self._tasks.copy()
-
+    def tasks(self) -> Tuple[Task, ...]:
+        """Lock-free tasks access (immutable tuple, replaced wholesale on change)."""
+        return self._tasks
 
+    def snapshot_tasks(self) -> List[Task]:
+        """Mutable copy of the task list for callers that need to reorder or edit it."""
+        return list(self._tasks)
 
     def add_state_callback(self, callback: Callable[[TimerState], None]) -> None:
         """Add callback for state changes."""
         with self._lock:
-            self._state_callbacks.append(callback)
+            self._state_callbacks = self._state_callbacks + (callback,)
     
     def add_ai_snapshot_callback(self, callback: Callable[[], None]) -> None:
         """Add callback for AI snapshot intervals."""
         with self._lock:
-            self._ai_snapshot_callbacks.append(callback)
+            self._ai_snapshot_callbacks = self._ai_snapshot_callbacks + (callback,)
+    
+    def close(self) -> None:
+        """Stop the snapshot worker. Pending snapshots are dropped."""
+        with self._lock:
+            # Later snapshot deadlines become no-ops instead of submitting to
+            # a shut-down executor
+            self._flags |= _FLAG_CLOSED
+            self._snapshot_executor.shutdown(wait=False, cancel_futures=True)
     
     def _trigger_ai_snapshot(self) -> None:
-        """Trigger AI snapshot and notify all callbacks."""
-        # Call all registered AI snapshot callbacks
-        for callback in self._ai_snapshot_callbacks:
+        """Trigger AI snapshot on the snapshot worker thread."""
+        self._snapshot_executor.submit(self._run_ai_snapshot_callbacks)
+    
+    def _run_ai_snapshot_callbacks(self) -> None:
+        """Notify all registered AI snapshot callbacks."""
+        callbacks = self._ai_snapshot_callbacks
+        if len(callbacks) == 1:
+            # Common case: a single listener (the GUI)
+            try:
+                callbacks[0]()
+            except Exception as e:
+                print(f"AI snapshot callback error: {e}")
+            return
+        for callback in callbacks:
             try:
                 callback()
             except Exception as e:
                 print(f"AI snapshot callback error: {e}")
     
-    def _check_ai_snapshot_trigger(self) -> None:
-        """Check if it's time to trigger an AI snapshot synchronized with display clock."""
-        if not self._ai_snapshot_callbacks:
-            return  # No callbacks registered, skip
-            
+    def _schedule_ai_snapshots(self, start: int) -> None:
+        """Set the first snapshot deadline for a work interval starting at `start`."""
+        self._next_ai_snapshot_at = start + self._ai_checkin_interval
+    
+    def _check_ai_snapshot_trigger(self, now: int) -> bool:
+        """Check if it's time to trigger an AI snapshot at the caller's clock reading."""
         # Only trigger during active work states (not breaks, paused, etc.)
-        if self._state not in [TimerState.WORK]:
-            return  # Skip during breaks/paused
-            
-        if self._start_time is None or self._end_time is None:
-            return  # No timing info available
-            
-        current_time = time.time()
-        
-        # Calculate elapsed time in current interval (synchronized with display clock)
-        interval_length = self._get_current_interval_length()
-        elapsed_time = interval_length - (self._end_time - current_time)
-        
-        # Calculate how many AI snapshots should have occurred by now
-        snapshots_due = int(elapsed_time // self._ai_checkin_interval)
+        if self._state is not TimerState.WORK:
+            return False  # Skip during breaks/paused
+        if not self._ai_snapshot_callbacks:
+            return False  # No callbacks registered, skip
+        if self._flags & _FLAG_CLOSED:
+            return False  # close() has stopped the snapshot worker
         
-        # FIX: _last_ai_snapshot is initialized as int=0, not None, so this condition never triggers
-        # Just ensure it's initialized properly
-        if self._last_ai_snapshot < 0:  # Changed from None check
-            self._last_ai_snapshot = 0  # Track number of snapshots taken
+        next_at = self._next_ai_snapshot_at
+        if now < next_at:
+            return False  # Common case: nothing due yet
         
-        # Check if we need to trigger more snapshots
-        if snapshots_due > self._last_ai_snapshot:
-            # Update count BEFORE triggering to prevent recursive loops
-            self._last_ai_snapshot = snapshots_due
-            self._trigger_ai_snapshot()
+        # Advance BEFORE triggering to prevent recursive loops; skip every
+        # deadline already due so a late poll fires only once
+        interval = self._ai_checkin_interval
+        self._next_ai_snapshot_at = next_at + ((now - next_at) // interval + 1) * interval
+        self._trigger_ai_snapshot()
+        return True
 
+    @safe_execute_bool(ErrorMessages.TIMER_START_ERROR)
     def start(self) -> bool:
         """Start or resume the timer. Returns success status."""
-        try:
-            with self._lock:
-                now = time.time()
-                
-                if self._state == TimerState.PAUSED and self._paused_remaining is not None:
-                    # Resume from pause - use stored remaining time
-                    self._start_time = now
-                    self._end_time = now + self._paused_remaining
-                    # Restore the previous state (what we were doing before pause)
-                    if self._pre_pause_state is not None:
-                        self._state = self._pre_pause_state
-                    else:
-                        self._state = TimerState.WORK  # Default fallback
-                    # Clear pause state
-                    self._paused_remaining = None
-                    self._pre_pause_state = None
-                    
-                    # AI snapshot timing continues from where it left off (no reset needed)
-                    
-                    # Ensure task status is IN_PROGRESS when resuming work
-                    if self._state == TimerState.WORK and self._current_task_idx < len(self._tasks):
-                        current_task = self._tasks[self._current_task_idx]
-                        current_task.status = TaskStatus.IN_PROGRESS
+        with self._lock:
+            now = _monotonic_ns()
+
+            if self._state is TimerState.PAUSED and self._paused_remaining is not None:
+                # Resume from pause - use stored remaining time
+                # Shift the pending snapshot deadline by the time spent paused
+                old_end = self._end_time
+                if old_end is not None:
+                    self._next_ai_snapshot_at += now + self._paused_remaining - old_end
+                self._start_time = now
+                self._end_time = now + self._paused_remaining
+                # Restore the previous state (what we were doing before pause)
+                if self._pre_pause_state is not None:
+                    self._state = self._pre_pause_state
                 else:
-                    # Start new interval
-                    if self._current_task_idx >= len(self._tasks):
-                        return False  # No more tasks
-                    
-                    self._state = TimerState.WORK
-                    self._start_time = now
-                    self._end_time = now + self._config.work_seconds
-                    
-                    # Reset AI snapshot count for new work session
-                    self._last_ai_snapshot = 0
-                    
-                    # Update task status to IN_PROGRESS
+                    self._state = TimerState.WORK  # Default fallback
+                # Clear pause state
+                self._paused_remaining = None
+                self._pre_pause_state = None
+
+                # Ensure task status is IN_PROGRESS when resuming work
+                if self._state is TimerState.WORK and self._current_task_idx < len(self._tasks):
                     current_task = self._tasks[self._current_task_idx]
                     current_task.status = TaskStatus.IN_PROGRESS
-                
-                self._notify_state_change(self._state)
-                return True
-                
-        except Exception as e:
-            # Edge device safeguard
-            print(f"{ErrorMessages.TIMER_START_ERROR}: {e}")
-            return False
+            else:
+                # Start new interval
+                if self._current_task_idx >= len(self._tasks):
+                    return False  # No more tasks
+
+                self._state = TimerState.WORK
+                self._start_time = now
+                self._end_time = now + self._config._length_by_state[TimerState.WORK]
+
+                # Fresh snapshot schedule for new work session
+                self._schedule_ai_snapshots(now)
+
+                # Update task status to IN_PROGRESS
+                current_task = self._tasks[self._current_task_idx]
+                current_task.status = TaskStatus.IN_PROGRESS
+
+            self._pending_states.append(self._state)
+        self._flush_state_changes()
+        return True
 
     def pause(self) -> bool:
         """Pause the timer. Returns success status."""
-        try:
-            with self._lock:
-                if self._state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-                    # Store the current state and remaining time before pausing
-                    self._pre_pause_state = self._state
-                    if self._end_time and self._start_time:
-                        now = time.time()
-                        self._paused_remaining = max(0, self._end_time - now)
-                    self._state = TimerState.PAUSED
-                    self._notify_state_change(self._state)
-                    return True
+        with self._lock:
+            if self._state not in _ACTIVE_STATES:
                 return False
-        except Exception as e:
-            print(f"{ErrorMessages.TIMER_PAUSE_ERROR}: {e}")
-            return False
+            # Store the current state and remaining time before pausing
+            now = _monotonic_ns()
+            self._pre_pause_state = self._state
+            if self._end_time and self._start_time:
+                self._paused_remaining = max(0, self._end_time - now)
+            self._state = TimerState.PAUSED
+            self._pending_states.append(self._state)
+        self._flush_state_changes()
+        return True
 
+    @safe_execute_bool(ErrorMessages.TIMER_SKIP_ERROR)
     def skip(self) -> bool:
         """Skip the current interval. Returns success status."""
-        try:
-            with self._lock:
-                if self._state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK, TimerState.PAUSED]:
-                    # Handle skipping while paused
-                    if self._state == TimerState.PAUSED:
-                        # Use the pre-pause state and remaining time
-                        self._pre_skip_state = self._pre_pause_state if self._pre_pause_state else TimerState.WORK
-                        self._skipped_remaining = self._paused_remaining if self._paused_remaining else 0
-                    else:
-                        # Store the current state and remaining time before skipping
-                        self._pre_skip_state = self._state
-                        if self._end_time and self._start_time:
-                            now = time.time()
-                            self._skipped_remaining = max(0, self._end_time - now)
-                    
-                    # Set to SKIPPED state for display
-                    self._state = TimerState.SKIPPED
-                    self._skip_display_shown = False  # Reset display flag
-                    self._notify_state_change(self._state)
-                    
-                    # Set end time to allow SKIPPED display to be visible
-                    self._end_time = time.time() + SKIP_DISPLAY_DURATION_SECONDS
-                    
-                    return True
+        with self._lock:
+            if self._state not in _SKIPPABLE_STATES:
                 return False
-        except Exception as e:
-            print(f"{ErrorMessages.TIMER_SKIP_ERROR}: {e}")
-            return False
+            self._enter_skip_state(_monotonic_ns())
+        self._flush_state_changes()
+        return True
 
+    @safe_execute_bool(ErrorMessages.TIMER_SKIP_ERROR)
     def skip_to_state(self, target_state: TimerState) -> bool:
         """Skip to a specific state. Returns success status."""
-        try:
-            with self._lock:
-                if self._state == target_state:
-                    return True  # Already in target state
-                
-                if self._state not in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK, TimerState.PAUSED]:
-                    return False  # Can't skip from invalid states
-                
-                # Remember if we were paused when we started the skip
-                was_paused = self._state == TimerState.PAUSED
-                self._start_new_state_paused = was_paused
-                
-                # Handle skipping while paused
-                if self._state == TimerState.PAUSED:
-                    # Use the pre-pause state and remaining time
-                    self._pre_skip_state = self._pre_pause_state if self._pre_pause_state else TimerState.WORK
-                    self._skipped_remaining = self._paused_remaining if self._paused_remaining else 0
-                else:
-                    # Store the current state and remaining time before skipping
-                    self._pre_skip_state = self._state
-                    if self._end_time and self._start_time:
-                        now = time.time()
-                        self._skipped_remaining = max(0, self._end_time - now)
-                
-                # Determine if we should complete a pomodoro
-                actual_current_state = self._pre_skip_state if self._state == TimerState.PAUSED else self._state
-                
-                if actual_current_state == TimerState.WORK and target_state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-                    # WORK -> BREAK: Complete the pomodoro (same as regular skip)
-                    self._completed_pomos += 1
-                    if self._current_task_idx < len(self._tasks):
-                        current_task = self._tasks[self._current_task_idx]
-                        current_task.completed_pomodoros += 1
-                        
-                        # Check if task is completed
-                        if current_task.completed_pomodoros >= current_task.estimated_pomodoros:
-                            current_task.status = TaskStatus.COMPLETED
-                            self._current_task_idx += 1
-                
-                # Set to SKIPPED state for display (preserves same skip logic)
-                self._state = TimerState.SKIPPED
-                self._skip_display_shown = False  # Reset display flag
-                self._notify_state_change(self._state)
-                
-                # Set end time to allow SKIPPED display to be visible
-                self._end_time = time.time() + SKIP_DISPLAY_DURATION_SECONDS
-                
-                # Store the target state so _handle_interval_completion knows where to go
-                self._target_state = target_state
-                
-                return True
-                
-        except Exception as e:
-            print(f"{ErrorMessages.TIMER_SKIP_ERROR}: {e}")
-            return False
+        with self._lock:
+            if self._state is target_state:
+                return True  # Already in target state
+
+            if self._state not in _SKIPPABLE_STATES:
+                return False  # Can't skip from invalid states
+
+            # Remember if we were paused when we started the skip
+            if self._state is TimerState.PAUSED:
+                self._flags |= _FLAG_START_PAUSED
+            else:
+                self._flags &= ~_FLAG_START_PAUSED
+
+            self._enter_skip_state(_monotonic_ns(), target_state)
+
+            if self._pre_skip_state is TimerState.WORK and target_state in _BREAK_STATES:
+                # WORK -> BREAK: Complete the pomodoro now; _handle_interval_completion
+                # follows the target state and won't count it again
+                self._complete_current_pomodoro()
+        self._flush_state_changes()
+        return True
+
+    def _complete_current_pomodoro(self) -> int:
+        """Count a finished pomodoro and advance past a completed task. Returns the new total. Lock must be held."""
+        completed = self._completed_pomos + 1
+        self._completed_pomos = completed
+        idx = self._current_task_idx
+        if idx < len(self._tasks):
+            current_task = self._tasks[idx]
+            current_task.completed_pomodoros += 1
+            
+            # Check if task is completed
+            if current_task.completed_pomodoros >= current_task.estimated_pomodoros:
+                current_task.status = TaskStatus.COMPLETED
+                self._current_task_idx = idx + 1
+        return completed
+
+    def _enter_skip_state(self, now: int, target: Optional[TimerState] = None) -> None:
+        """Move a skippable state into SKIPPED. Lock must be held."""
+        if self._state is TimerState.PAUSED:
+            # Use the pre-pause state and remaining time
+            self._pre_skip_state = self._pre_pause_state if self._pre_pause_state is not None else TimerState.WORK
+            self._skipped_remaining = self._paused_remaining if self._paused_remaining else 0
+        else:
+            # Store the current state and remaining time before skipping
+            self._pre_skip_state = self._state
+            if self._end_time and self._start_time:
+                self._skipped_remaining = max(0, self._end_time - now)
+        
+        # Set to SKIPPED state for display
+        self._state = TimerState.SKIPPED
+        self._flags &= ~_FLAG_SKIP_DISPLAY  # Reset display flag
+        self._pending_states.append(TimerState.SKIPPED)
+        
+        # Set end time to allow SKIPPED display to be visible
+        self._end_time = now + _SKIP_DISPLAY_NS
+        
+        # Store the target state so _handle_interval_completion knows where to go.
+        # A plain skip() passes None, clearing any target left over from a
+        # skip_to_state() that start() interrupted during SKIPPED
+        self._target_state = target
+
+    def next_event_time(self) -> Optional[float]:
+        """Time of the next interval end or AI snapshot, on the time.monotonic() clock.
+        
+        None when nothing is scheduled (idle or paused). Lets a display loop sleep
+        until something changes instead of polling at a fixed rate.
+        """
+        with self._lock:
+            state = self._state
+            end = self._end_time
+            if end is None or state is TimerState.IDLE or state is TimerState.PAUSED:
+                return None
+            next_at = end
+            if state is TimerState.WORK and self._ai_snapshot_callbacks and self._next_ai_snapshot_at < end:
+                next_at = self._next_ai_snapshot_at
+        return next_at / _NS_PER_SECOND
 
     def get_remaining_time(self) -> Optional[timedelta]:
-        """Get remaining time in current interval."""
-        try:
-            with self._lock:
-                if not self._start_time or not self._end_time or self._state == TimerState.IDLE:
-                    return None
-                
-                # If paused, return the stored remaining time
-                if self._state == TimerState.PAUSED:
-                    if self._paused_remaining is not None:
-                        return timedelta(seconds=max(0, self._paused_remaining))
-                    else:
-                        # Fallback calculation if paused_remaining not stored
-                        now = time.time()
-                        return timedelta(seconds=max(0, self._end_time - now))
-                
-                # If skipped, handle display and completion
-                if self._state == TimerState.SKIPPED:
-                    now = time.time()
-                    if now >= self._end_time and self._skip_display_shown:
-                        # Complete the skip after display period
-                        self._handle_interval_completion()
-                        return self.get_remaining_time()
-                    else:
-                        # Mark that we've shown the skip display
-                        self._skip_display_shown = True
-                        
-                        # If we have a target state (from skip_to_state), show the full time for that state
-                        if self._target_state:
-                            target_length = self._get_target_state_length()
-                            return timedelta(seconds=target_length)
-                        else:
-                            # Regular skip - return the stored remaining time at skip point
-                            if self._skipped_remaining is not None:
-                                return timedelta(seconds=max(0, self._skipped_remaining))
-                            else:
-                                return timedelta(seconds=0)  # Fallback for skipped
-                
-                now = time.time()
-                if now >= self._end_time:
-                    self._handle_interval_completion()
-                    return self.get_remaining_time()
-                
-                # Check for AI snapshot trigger during active timer operation
-                self._check_ai_snapshot_trigger()
-                
-                return timedelta(seconds=max(0, self._end_time - now))
-        except Exception as e:
-            print(f"Timer remaining time error: {e}")
+        """Get remaining time in current interval, at whole-second (display) resolution."""
+        remaining = self.get_remaining_seconds()
+        if remaining is None:
             return None
+        seconds = int(remaining)
+        if seconds <= 0:
+            return _ZERO_TD
+        # Consecutive polls mostly land in the same second: reuse that timedelta
+        cached = self._remaining_td_cache
+        if cached[0] == seconds:
+            return cached[1]
+        td = timedelta(seconds=seconds)
+        self._remaining_td_cache = (seconds, td)
+        return td
+
+    def get_remaining_seconds(self) -> Optional[float]:
+        """Get remaining seconds in current interval (no timedelta allocation)."""
+        return self.tick().remaining_seconds
+
+    def tick(self) -> TickResult:
+        """Advance the timer and report remaining time, snapshot trigger and state in one locked pass."""
+        with self._lock:
+            remaining, take_snapshot = self._advance(_monotonic_ns())
+            result = TickResult(remaining, take_snapshot, self._state)
+        if self._pending_states:
+            self._flush_state_changes()
+        return result
+
+    def _advance(self, now: int) -> Tuple[Optional[float], bool]:
+        """Roll over finished intervals; return (remaining seconds, snapshot triggered). Lock must be held."""
+        # Loop rather than recurse when an interval rolls over; the cap
+        # guards against spinning on malformed state
+        for _ in range(MAX_ROLLOVERS_PER_POLL):
+            state = self._state
+            end = self._end_time
+            
+            # Hot path first: an active interval is by far the common case
+            # (entering any active state always sets start/end times)
+            if state in _ACTIVE_STATES:
+                assert end is not None
+                if now >= end:
+                    self._handle_interval_completion(now)
+                    # A fresh active interval starts at `now`: answer it directly
+                    # (no snapshot can be due yet) instead of re-running the cascade
+                    new_end = self._end_time
+                    if self._state in _ACTIVE_STATES and new_end is not None:
+                        return (new_end - now) / _NS_PER_SECOND, False
+                    continue
+                # Check for AI snapshot trigger during active timer operation
+                take_snapshot = self._check_ai_snapshot_trigger(now)
+                return max(0, end - now) / _NS_PER_SECOND, take_snapshot
+            
+            if state is TimerState.IDLE or not self._start_time or not end:
+                return None, False
+            
+            # If paused, return the stored remaining time
+            if state is TimerState.PAUSED:
+                paused_remaining = self._paused_remaining
+                if paused_remaining is not None:
+                    return max(0, paused_remaining) / _NS_PER_SECOND, False
+                # Fallback calculation if paused_remaining not stored
+                return max(0, end - now) / _NS_PER_SECOND, False
+            
+            # SKIPPED: hold the skip display, then complete the skip
+            if now >= end and self._flags & _FLAG_SKIP_DISPLAY:
+                self._handle_interval_completion(now)
+                continue
+            # Mark that we've shown the skip display
+            self._flags |= _FLAG_SKIP_DISPLAY
+            # If we have a target state (from skip_to_state), show the full time for that state
+            if self._target_state is not None:
+                return self._get_target_state_length() / _NS_PER_SECOND, False
+            # Regular skip - return the stored remaining time at skip point
+            skipped_remaining = self._skipped_remaining
+            if skipped_remaining is not None:
+                return max(0, skipped_remaining) / _NS_PER_SECOND, False
+            return 0.0, False  # Fallback for skipped
+        return None, False
 
 
 
+    def _flush_state_changes(self) -> None:
+        """Deliver queued state changes to callbacks. Must be called without the lock."""
+        while self._pending_states:
+            # One deliverer at a time keeps notifications in queue order. If
+            # another thread (or a callback up this thread's stack) is already
+            # delivering, it drains what we queued; the recheck after release
+            # catches states queued just as it finished
+            if not self._delivery_lock.acquire(blocking=False):
+                return
+            try:
+                while True:
+                    with self._lock:
+                        pending, self._pending_states = self._pending_states, []
+                    if not pending:
+                        break
+                    for state in pending:
+                        self._notify_state_change(state)
+            finally:
+                self._delivery_lock.release()
+
     def _notify_state_change(self, new_state: TimerState) -> None:
-        """Notify state change callbacks."""
-        for callback in self._state_callbacks:
+        """Notify state change callbacks. Runs without the lock on a snapshot of the callback tuple."""
+        callbacks = self._state_callbacks
+        if not callbacks:
+            return
+        if len(callbacks) == 1:
+            # Common case: a single listener (the GUI)
+            try:
+                callbacks[0](new_state)
+            except Exception as e:
+                print(f"State callback error: {e}")
+            return
+        for callback in callbacks:
             try:
                 callback(new_state)
             except Exception as e:
                 print(f"State callback error: {e}")
 
-    def _get_current_interval_length(self) -> float:
-        """Get the length of the current interval in seconds."""
-        # Handle SKIPPED state by using the pre-skip state
-        actual_state = self._state
-        if self._state == TimerState.SKIPPED and self._pre_skip_state:
-            actual_state = self._pre_skip_state
-            
-        if actual_state == TimerState.WORK:
-            return self._config.work_seconds
-        elif actual_state == TimerState.SHORT_BREAK:
-            return self._config.short_break_seconds
-        elif actual_state == TimerState.LONG_BREAK:
-            return self._config.long_break_seconds
-        return 0
-
-    def _get_target_state_length(self) -> float:
-        """Get the length of the target state interval in seconds."""
-        if not self._target_state:
-            return 0
-            
-        if self._target_state == TimerState.WORK:
-            return self._config.work_seconds
-        elif self._target_state == TimerState.SHORT_BREAK:
-            return self._config.short_break_seconds
-        elif self._target_state == TimerState.LONG_BREAK:
-            return self._config.long_break_seconds
-        return 0
+    def _get_target_state_length(self) -> int:
+        """Get the length of the target state interval in nanoseconds."""
+        return self._config._length_by_state.get(self._target_state, 0)
         
-    def _handle_interval_completion(self) -> bool:
-        """Handle the completion of a work or break interval."""
+    def _handle_interval_completion(self, now: int) -> bool:
+        """Handle the completion of a work or break interval; the next one starts at ``now``."""
         try:
+            WORK = TimerState.WORK
+            tasks = self._tasks
+            idx = self._current_task_idx
+            has_task = idx < len(tasks)
+            
             # Check if we're using skip_to_state with a target state
-            if self._target_state:
+            target_state = self._target_state
+            if target_state is not None:
                 # Use the target state instead of normal logic
-                self._state = self._target_state
+                state = target_state
                 # Set current task status to IN_PROGRESS when skipping to work
-                if self._target_state == TimerState.WORK and self._current_task_idx < len(self._tasks):
-                    current_task = self._tasks[self._current_task_idx]
-                    current_task.status = TaskStatus.IN_PROGRESS
+                if state is WORK and has_task:
+                    tasks[idx].status = TaskStatus.IN_PROGRESS
                 # Note: If skip_to_state already handled pomodoro completion, we don't need to do it again
             else:
                 # Normal completion logic
                 # Determine the actual state that was being executed (handle SKIPPED)
                 actual_state = self._state
-                if self._state == TimerState.SKIPPED and self._pre_skip_state:
+                if actual_state is TimerState.SKIPPED and self._pre_skip_state is not None:
                     actual_state = self._pre_skip_state
                 
-                if actual_state == TimerState.WORK:
-                    # Complete pomodoro
-                    self._completed_pomos += 1
-                    if self._current_task_idx < len(self._tasks):
-                        current_task = self._tasks[self._current_task_idx]
-                        current_task.completed_pomodoros += 1
-                        
-                        # Check if task is completed
-                        if current_task.completed_pomodoros >= current_task.estimated_pomodoros:
-                            current_task.status = TaskStatus.COMPLETED
-                            self._current_task_idx += 1
-                        
-                    # Determine break type
-                    if self._completed_pomos % self._config.pomos_before_long_break == 0:
-                        self._state = TimerState.LONG_BREAK
-                    else:
-                        self._state = TimerState.SHORT_BREAK
-                        
-                else:  # After break
-                    if self._current_task_idx < len(self._tasks):
-                        self._state = TimerState.WORK
-                        # Set current task status to IN_PROGRESS when starting work
-                        current_task = self._tasks[self._current_task_idx]
-                        current_task.status = TaskStatus.IN_PROGRESS
-                    else:
-                        self._state = TimerState.IDLE
-                        self._notify_state_change(self._state)
-                        return True
+                was_work = actual_state is WORK
+                long_break_due = False
+                if was_work:
+                    completed = self._complete_current_pomodoro()
+                    long_break_due = completed % self._config.pomos_before_long_break == 0
+                
+                state = _NEXT_STATE[was_work, long_break_due, has_task]
+                if state is TimerState.IDLE:
+                    self._state = TimerState.IDLE
+                    self._pending_states.append(TimerState.IDLE)
+                    return True
+                if state is WORK:
+                    # Set current task status to IN_PROGRESS when starting work
+                    tasks[idx].status = TaskStatus.IN_PROGRESS
             
             # Clear skip state since we've handled completion
             self._pre_skip_state = None
             self._skipped_remaining = None
-            self._skip_display_shown = False
+            self._flags &= ~_FLAG_SKIP_DISPLAY
             self._target_state = None  # Clear target state
                 
             # Start new interval
-            now = time.time()
+            end = now + self._config._length_by_state.get(state, 0)
             self._start_time = now
-            self._end_time = now + self._get_current_interval_length()
+            self._end_time = end
             
-            # Reset AI snapshot count for new work intervals
-            if self._state == TimerState.WORK:
-                self._last_ai_snapshot = 0
+            # Fresh snapshot schedule for new work intervals
+            if state is WORK:
+                self._schedule_ai_snapshots(now)
             
             # If we were paused when we started the skip, immediately pause the new state
-            if self._start_new_state_paused:
-                self._pre_pause_state = self._state
-                self._paused_remaining = self._end_time - now  # Full duration since we just started
-                self._state = TimerState.PAUSED
-                self._start_new_state_paused = False  # Reset flag
+            if self._flags & _FLAG_START_PAUSED:
+                self._pre_pause_state = state
+                self._paused_remaining = end - now  # Full duration since we just started
+                state = TimerState.PAUSED
+                self._flags &= ~_FLAG_START_PAUSED  # Reset flag
             
-            self._notify_state_change(self._state)
+            self._state = state
+            self._pending_states.append(state)
             return True
             
         except Exception as e:
@@ -2,148 +2,284 @@
 Utility functions for the Pomodoro timer application.
 """
 
-import time
+import itertools
+import logging
 import threading
 from datetime import timedelta
 from functools import wraps
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, List, TypeVar, Union, cast
 from .constants import Limits, ErrorMessages, MAX_TASKS_EDGE_DEVICE
 
+# Limits and messages bound once at import, not looked up per validation call
+_MIN_TIMER_S = Limits.MIN_TIMER_SECONDS
+_MAX_TIMER_S = Limits.MAX_TIMER_SECONDS
+_MIN_POMO = Limits.MIN_POMODOROS
+_MAX_POMO = Limits.MAX_POMODOROS
+_ERR_INVALID_TASKS = ErrorMessages.INVALID_TASKS
+_ERR_TOO_MANY = ErrorMessages.TOO_MANY_TASKS
+
 # Time Utilities
+# "Ns" strings for the sub-minute bucket of format_seconds
+_SEC_STR = tuple(f"{i}s" for i in range(60))
+
+# "Mm Ss" strings for format_seconds, indexed by whole seconds (entries
+# below 60 are unused: that bucket is served by _SEC_STR)
+_MIN_SEC_TABLE = tuple(f"{i // 60}m {i % 60}s" for i in range(3600))
+
+
+# Every MM:SS string under an hour, indexed by whole seconds
+_MMSS_TABLE = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3600))
+
+
+def format_seconds(seconds: Union[int, float]) -> str:
+    """Format seconds as human-readable time string."""
+    total_seconds = seconds if type(seconds) is int else int(seconds)
+    if 0 <= total_seconds < 60:
+        return _SEC_STR[total_seconds]
+    if 60 <= total_seconds < 3600:
+        return _MIN_SEC_TABLE[total_seconds]
+    # Rare: an hour or more, or negative
+    if total_seconds < 0:
+        return f"{total_seconds}s"
+    minutes, remaining_seconds = divmod(total_seconds, 60)
+    hours, remaining_minutes = divmod(minutes, 60)
+    return " ".join((f"{hours}h", f"{remaining_minutes}m", _SEC_STR[remaining_seconds]))
+
+
+def format_timer_display(seconds: Union[int, float]) -> str:
+    """Format seconds for timer display (MM:SS)."""
+    return format_timer_display_int(seconds if type(seconds) is int else int(seconds))
+
+
+def format_timer_display_int(total_seconds: int) -> str:
+    """format_timer_display for callers that already hold whole seconds as an int."""
+    if 0 <= total_seconds < 3600:
+        return _MMSS_TABLE[total_seconds]
+    minutes, remaining_seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{remaining_seconds:02d}"
+
+
+def timedelta_to_seconds(td: timedelta) -> float:
+    """Convert timedelta to seconds."""
+    return td.total_seconds()
+
+
+def seconds_to_timedelta(seconds: Union[int, float]) -> timedelta:
+    """Convert seconds to timedelta."""
+    return timedelta(seconds=seconds)
+
+
 class TimeUtils:
-    """Time formatting and calculation utilities."""
-    
-    @staticmethod
-    def format_seconds(seconds: Union[int, float]) -> str:
-        """Format seconds as human-readable time string."""
-        total_seconds = int(seconds)
-        if total_seconds < 60:
-            return f"{total_seconds}s"
-        minutes, remaining_seconds = divmod(total_seconds, 60)
-        if minutes < 60:
-            return f"{minutes}m {remaining_seconds}s"
-        hours, remaining_minutes = divmod(minutes, 60)
-        return f"{hours}h {remaining_minutes}m {remaining_seconds}s"
+    """Time formatting and calculation utilities (namespace over the module functions)."""
     
-    @staticmethod
-    def format_timer_display(seconds: Union[int, float]) -> str:
-        """Format seconds for timer display (MM:SS)."""
-        total_seconds = int(seconds)
-        minutes, remaining_seconds = divmod(total_seconds, 60)
-        return f"{minutes:02d}:{remaining_seconds:02d}"
-    
-    @staticmethod
-    def timedelta_to_seconds(td: timedelta) -> float:
-        """Convert timedelta to seconds."""
-        return td.total_seconds()
-    
-    @staticmethod
-    def seconds_to_timedelta(seconds: Union[int, float]) -> timedelta:
-        """Convert seconds to timedelta."""
-        return timedelta(seconds=seconds)
+    format_seconds = staticmethod(format_seconds)
+    format_timer_display = staticmethod(format_timer_display)
+    format_timer_display_int = staticmethod(format_timer_display_int)
+    timedelta_to_seconds = staticmethod(timedelta_to_seconds)
+    seconds_to_timedelta = staticmethod(seconds_to_timedelta)
 
 
 # Simple error handling
+_ERROR_LOG = logging.getLogger(__name__)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
 def safe_execute(error_message: str = "Operation failed", 
                 return_value: Any = None, 
-                log_errors: bool = True):
+                log_errors: bool = True) -> Callable[[_F], _F]:
     """Decorator for safe function execution with error handling."""
-    def decorator(func: Callable) -> Callable:
+    def decorator(func: _F) -> _F:
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 if log_errors:
-                    print(f"Error in {func.__name__}: {e}")
+                    # Lazy %-formatting: nothing is built if ERROR is filtered out
+                    _ERROR_LOG.error("%s: %s", error_message, e)
                 return return_value
-        return wrapper
+        return cast(_F, wrapper)
     return decorator
 
 
-def safe_execute_bool(error_message: str = "Operation failed"):
+def safe_execute_bool(error_message: str = "Operation failed") -> Callable[[_F], _F]:
     """Decorator for safe boolean returns."""
     return safe_execute(error_message, False)
 
 
-def safe_execute_none(error_message: str = "Operation failed"):
+def safe_execute_none(error_message: str = "Operation failed") -> Callable[[_F], _F]:
     """Decorator for safe None returns."""
     return safe_execute(error_message, None)
 
 
 # Validation utilities
-class ValidationUtils:
-    """Input validation utilities."""
-    
-    @staticmethod
-    def validate_positive_number(value: Union[int, float], 
-                               name: str = "value") -> Union[int, float]:
-        """Validate that a number is positive."""
-        if value <= 0:
-            raise ValueError(f"{name} must be positive, got {value}")
-        return value
+# Error message templates, formatted only when a check fails
+_ERR_POSITIVE = "%s must be positive, got %s"
+_ERR_RANGE_PREFIX = "%s must be between %s and %s, got "
+_ERR_EMPTY = "%s cannot be empty"
+
+
+def _make_range_validator(min_val: Union[int, float], max_val: Union[int, float],
+                          name: str, func_name: str,
+                          doc: str) -> Callable[[Union[int, float]], Union[int, float]]:
+    """Build a range validator with its bounds and name captured.
     
-    @staticmethod
-    def validate_range(value: Union[int, float], 
-                      min_val: Union[int, float], 
-                      max_val: Union[int, float],
-                      name: str = "value") -> Union[int, float]:
-        """Validate that a value is within a range."""
-        if value < min_val or value > max_val:
-            raise ValueError(f"{name} must be between {min_val} and {max_val}, got {value}")
+    The returned function is given `func_name` and `doc` so it introspects
+    (help(), tracebacks, logs) like a plain module-level def.
+    """
+    # Message prefix is fixed per validator, so build it once
+    prefix = _ERR_RANGE_PREFIX % (name, min_val, max_val)
+    def validate(value: Union[int, float]) -> Union[int, float]:
+        if min_val <= value <= max_val:
+            return value
+        raise ValueError(prefix + str(value))
+    validate.__name__ = validate.__qualname__ = func_name
+    validate.__doc__ = doc
+    return validate
+
+
+_validate_pomodoro_range = _make_range_validator(
+    _MIN_POMO, _MAX_POMO, "pomodoros", "_validate_pomodoro_range",
+    "Validate a pomodoro count is within acceptable range.")
+
+
+def validate_positive_number(value: Union[int, float], 
+                             name: str = "value") -> Union[int, float]:
+    """Validate that a number is positive."""
+    if value <= 0:
+        raise ValueError(_ERR_POSITIVE % (name, value))
+    return value
+
+
+def validate_range(value: Union[int, float], 
+                   min_val: Union[int, float], 
+                   max_val: Union[int, float],
+                   name: str = "value") -> Union[int, float]:
+    """Validate that a value is within a range."""
+    if min_val <= value <= max_val:
         return value
+    raise ValueError(_ERR_RANGE_PREFIX % (name, min_val, max_val) + str(value))
+
+
+# Bounds are pre-bound rather than passed through validate_range on each call
+validate_timer_seconds = _make_range_validator(
+    _MIN_TIMER_S, _MAX_TIMER_S, "timer_seconds", "validate_timer_seconds",
+    "Validate timer seconds are within acceptable range.")
+
+
+def validate_pomodoros(count: int) -> int:
+    """Validate pomodoro count is within acceptable range."""
+    return int(_validate_pomodoro_range(count))
+
+
+def validate_non_empty_string(value: str, name: str = "string") -> str:
+    """Validate that a string is not empty."""
+    if not value or not value.strip():
+        raise ValueError(_ERR_EMPTY % name)
+    return value.strip()
+
+
+def validate_task_list(tasks: List[Any]) -> List[Any]:
+    """Validate task list is not empty and within limits."""
+    n = len(tasks)
+    if n == 0:
+        raise ValueError(_ERR_INVALID_TASKS)
+    if n > MAX_TASKS_EDGE_DEVICE:
+        raise ValueError(_ERR_TOO_MANY)
+    return tasks
+
+
+class ValidationUtils:
+    """Input validation utilities (namespace over the module functions)."""
     
-    @staticmethod
-    def validate_timer_seconds(seconds: Union[int, float]) -> Union[int, float]:
-        """Validate timer seconds are within acceptable range."""
-        return ValidationUtils.validate_range(
-            seconds, Limits.MIN_TIMER_SECONDS, Limits.MAX_TIMER_SECONDS, "timer_seconds"
-        )
-    
-    @staticmethod
-    def validate_pomodoros(count: int) -> int:
-        """Validate pomodoro count is within acceptable range."""
-        return int(ValidationUtils.validate_range(
-            count, Limits.MIN_POMODOROS, Limits.MAX_POMODOROS, "pomodoros"
-        ))
-    
-    @staticmethod
-    def validate_non_empty_string(value: str, name: str = "string") -> str:
-        """Validate that a string is not empty."""
-        if not value or not value.strip():
-            raise ValueError(f"{name} cannot be empty")
-        return value.strip()
-    
-    @staticmethod
-    def validate_task_list(tasks: list) -> list:
-        """Validate task list is not empty and within limits."""
-        if not tasks:
-            raise ValueError(ErrorMessages.INVALID_TASKS)
-        if len(tasks) > MAX_TASKS_EDGE_DEVICE:
-            raise ValueError(ErrorMessages.TOO_MANY_TASKS)
-        return tasks
+    validate_positive_number = staticmethod(validate_positive_number)
+    validate_range = staticmethod(validate_range)
+    validate_timer_seconds = staticmethod(validate_timer_seconds)
+    validate_pomodoros = staticmethod(validate_pomodoros)
+    validate_non_empty_string = staticmethod(validate_non_empty_string)
+    validate_task_list = staticmethod(validate_task_list)
 
 
 # Thread-safe counter
 class ThreadSafeCounter:
-    """Thread-safe counter for tracking values."""
+    """Thread-safe counter for tracking values.
+    
+    Values are drawn lock-free: next() on an itertools.count runs in C
+    without releasing the GIL, so concurrent increments never hand out the
+    same value. Only the bookkeeping behind get() and reset() takes a lock;
+    get() returns the highest value issued since the last reset, so it
+    never goes backwards.
+    """
     
-    def __init__(self, initial_value: int = 0):
+    __slots__ = ('_counter', '_value', '_lock')
+    
+    def __init__(self, initial_value: int = 0) -> None:
+        self._counter: "itertools.count[int]" = itertools.count(initial_value + 1)
         self._value = initial_value
         self._lock = threading.Lock()
     
     def increment(self) -> int:
         """Increment and return new value."""
+        counter = self._counter
+        value = next(counter)
         with self._lock:
-            self._value += 1
-            return self._value
+            # Drop values drawn from a counter that reset() has since replaced,
+            # and never let a slower thread move get() back
+            if counter is self._counter and value > self._value:
+                self._value = value
+        return value
     
     def get(self) -> int:
-        """Get current value."""
+        """Get current value (the highest issued since the last reset)."""
         with self._lock:
             return self._value
     
     def reset(self) -> None:
         """Reset counter to zero."""
         with self._lock:
-            self._value = 0 
\ No newline at end of file
+            self._counter = itertools.count(1)
+            self._value = 0
+
+
+# Per-thread counter
+class PerThreadCounter:
+    """Counter with one slot per thread, summed on read.
+    
+    For write-heavy, read-rare metrics: an increment touches only the
+    calling thread's slot, so threads never contend. get() is approximate
+    while other threads are still incrementing.
+    """
+    
+    __slots__ = ('_local', '_cells', '_lock')
+    
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # One [count] cell per thread that has incremented; kept after the
+        # thread exits so its counts still add up
+        self._cells: List[List[int]] = []
+        self._lock = threading.Lock()
+    
+    def increment(self) -> None:
+        """Add one to the calling thread's slot."""
+        try:
+            self._local.cell[0] += 1
+        except AttributeError:
+            # First increment from this thread: register its cell
+            cell = [1]
+            self._local.cell = cell
+            with self._lock:
+                self._cells.append(cell)
+    
+    def get(self) -> int:
+        """Sum of all threads' counts."""
+        with self._lock:
+            cells = tuple(self._cells)
+        return sum(cell[0] for cell in cells)
+    
+    def reset(self) -> None:
+        """Reset every thread's slot to zero."""
+        with self._lock:
+            for cell in self._cells:
+                cell[0] = 0